@@ -2,6 +2,7 @@ import logging
 import json
 import os
 import csv
+import io
 import calendar
 from datetime import date, datetime, timedelta
 from telegram import (
@@ -88,6 +89,43 @@ def buat_progress_bar(persen: float, panjang: int = 10) -> str:
 def format_rupiah(nominal: int) -> str:
     return f"Rp{nominal:,}".replace(",", ".")
 
+def parse_rupiah(teks: str) -> int:
+    angka = teks.strip().removeprefix("Rp").replace(".", "").strip()
+    if not angka.isdigit():
+        raise ValueError(f"Jumlah tidak valid: {teks}")
+    return int(angka)
+
+def parse_riwayat_csv(baris) -> tuple:
+    """Parse baris CSV riwayat (format download_riwayat) satu per satu.
+
+    Mengembalikan (entries, errors): entries berisi {tanggal_key: amount},
+    errors berisi pesan untuk baris yang tidak valid.
+    """
+    reader = csv.reader(baris)
+    header = next(reader, None)
+    if not header or [h.strip() for h in header] != ["Tanggal", "Menabung", "Jumlah"]:
+        raise ValueError("Header harus: Tanggal, Menabung, Jumlah")
+
+    entries = {}
+    errors = []
+    for nomor, row in enumerate(reader, start=2):
+        if not row or not any(kolom.strip() for kolom in row):
+            continue
+        if len(row) != 3:
+            errors.append(f"Baris {nomor}: jumlah kolom harus 3")
+            continue
+        tgl, menabung, jumlah = (kolom.strip() for kolom in row)
+        if menabung != "Ya":
+            continue
+        try:
+            key = datetime.strptime(tgl, "%d-%b-%Y").strftime("%d-%b-%Y")
+            amount = parse_rupiah(jumlah)
+        except ValueError:
+            errors.append(f"Baris {nomor}: data tidak valid")
+            continue
+        entries[key] = amount
+    return entries, errors
+
 def get_user_target(user_id: str) -> tuple:
     targets = load_target()
     return targets.get(str(user_id)), targets
@@ -144,7 +182,8 @@ def main_menu(user_id: str = None) -> InlineKeyboardMarkup:
         [InlineKeyboardButton("📅 Statistik Bulan Ini", callback_data='statistik')],
         [InlineKeyboardButton("🎯 Target Nabung", callback_data='target_menu')],
         [InlineKeyboardButton("🗂️ Riwayat Tabungan", callback_data='riwayat')],
-        [InlineKeyboardButton("📥 Download Riwayat", callback_data='download_riwayat')]
+        [InlineKeyboardButton("📥 Download Riwayat", callback_data='download_riwayat')],
+        [InlineKeyboardButton("📤 Import Riwayat", callback_data='import_riwayat')]
     ])
     
     return InlineKeyboardMarkup(keyboard)
@@ -218,6 +257,8 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         await show_riwayat(query, context)
     elif data == 'download_riwayat':
         await download_riwayat(query, context)
+    elif data == 'import_riwayat':
+        await minta_import_riwayat(query, context)
     elif data.startswith("calendar_"):
         await calendar_handler(query, context)
     else:
@@ -630,12 +671,74 @@ async def download_riwayat(query: CallbackQuery, context: ContextTypes.DEFAULT_T
         if os.path.exists(temp_file):
             os.remove(temp_file)
 
+async def minta_import_riwayat(query: CallbackQuery, context: ContextTypes.DEFAULT_TYPE) -> None:
+    context.user_data["import_riwayat"] = True
+    await query.edit_message_text(
+        "📤 *Import Riwayat Tabungan*\n\n"
+        "Kirim file CSV dengan format yang sama seperti hasil Download Riwayat "
+        "(kolom: Tanggal, Menabung, Jumlah).",
+        parse_mode="Markdown"
+    )
+
+async def import_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    context.user_data["import_riwayat"] = True
+    await update.message.reply_text(
+        "📤 Kirim file CSV riwayat tabungan (kolom: Tanggal, Menabung, Jumlah)."
+    )
+
+async def handle_import_document(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    user_id = update.effective_user.id
+
+    if not context.user_data.pop("import_riwayat", False):
+        await update.message.reply_text("Silakan pilih menu Import Riwayat terlebih dahulu.")
+        return
+
+    try:
+        file = await update.message.document.get_file()
+        data = await file.download_as_bytearray()
+        with io.TextIOWrapper(io.BytesIO(data), encoding='utf-8-sig', newline='') as f:
+            entries, errors = parse_riwayat_csv(f)
+    except (ValueError, UnicodeDecodeError) as e:
+        await update.message.reply_text(f"❌ File tidak valid: {e}", reply_markup=main_menu(user_id))
+        return
+    except Exception as e:
+        logger.error(f"Gagal membaca file import: {e}")
+        await update.message.reply_text("❌ Maaf, gagal membaca file.", reply_markup=main_menu(user_id))
+        return
+
+    # Apply all rows in one load/save instead of writing per row
+    status = load_status()
+    diimpor = 0
+    bentrok = 0
+    for tgl, amount in entries.items():
+        existing = status.get(tgl)
+        if existing and existing.get("user_id") != str(user_id):
+            bentrok += 1
+            continue
+        status[tgl] = {
+            "saved": True,
+            "amount": amount,
+            "user_id": str(user_id)
+        }
+        diimpor += 1
+    if diimpor:
+        save_status(status)
+
+    response = f"✅ *Import selesai!*\n\n📥 Diimpor: {diimpor} hari"
+    if bentrok:
+        response += f"\n⚠️ Dilewati (tanggal sudah dipakai): {bentrok}"
+    if errors:
+        response += f"\n❌ Baris tidak valid: {len(errors)}\n" + "\n".join(errors[:10])
+
+    await update.message.reply_text(response, reply_markup=main_menu(user_id), parse_mode="Markdown")
+
 # Main Application
 def main() -> None:
     application = Application.builder().token(TOKEN).build()
 
     # Add handlers in correct order
     application.add_handler(CommandHandler("start", start))
+    application.add_handler(CommandHandler("import", import_command))
     application.add_handler(CallbackQueryHandler(button_handler))
     application.add_handler(CallbackQueryHandler(calendar_handler, pattern="^calendar_"))
     
@@ -644,6 +747,7 @@ def main() -> None:
         filters.TEXT & ~filters.COMMAND & filters.Regex(r'^\d+$'),
         handle_text_input
     ))
+    application.add_handler(MessageHandler(filters.Document.ALL, handle_import_document))
 
     logger.info("Bot sedang berjalan...")
     application.run_polling()